@@ -1,14 +1,72 @@
+from functools import wraps
 import streamlit as st
 import pandas as pd
-import plotly.express as px
 from forecast_utils import (
     preprocess_data, forecast_sales,
     calculate_target_analysis, generate_recommendations,
     plot_forecast, plot_actual_vs_forecast,
-    plot_daily_bar_chart, generate_daily_table,
+    plot_daily_bar_chart, plot_region_contribution_pie, generate_daily_table,
     get_forecast_explanation, detect_pattern,
-    forecast_by_region
+    forecast_by_region, aggregate_daily
 )
+from data_io import HEADER_ROWS, load_file
+
+# ---------------- CACHING ----------------
+def _frame_key(df):
+    return df.shape, tuple(df.columns), int(pd.util.hash_pandas_object(df).sum())
+
+cached = st.cache_data(show_spinner=False, hash_funcs={pd.DataFrame: _frame_key})
+
+load_file = cached(load_file)
+
+def cached_figure(plot_fn):
+    @wraps(plot_fn)
+    def spec(*args):
+        return plot_fn(*args).to_dict()
+    return cached(spec)
+
+preprocess_data = cached(preprocess_data)
+forecast_sales = cached(forecast_sales)
+forecast_by_region = cached(forecast_by_region)
+calculate_target_analysis = cached(calculate_target_analysis)
+aggregate_daily = cached(aggregate_daily)
+plot_forecast = cached_figure(plot_forecast)
+plot_actual_vs_forecast = cached_figure(plot_actual_vs_forecast)
+plot_daily_bar_chart = cached_figure(plot_daily_bar_chart)
+plot_region_contribution_pie = cached_figure(plot_region_contribution_pie)
+
+FORECAST_HORIZONS = {
+    "Till Month End": 'month_end',
+    "Till Quarter End": 'quarter_end',
+    "Till Year End": 'year_end',
+    "Custom Days": 'custom',
+}
+
+# ---------------- CHARTS ----------------
+@st.fragment
+def render_charts(df_clean, daily_actual, full_forecast_df, forecast_df, has_region, model_choice, event_dates, forecast_until, custom_days):
+    st.subheader("📈 Forecast Trend")
+    st.plotly_chart(plot_forecast(full_forecast_df), use_container_width=True)
+
+    st.subheader("📉 Actual vs Forecast")
+    st.plotly_chart(plot_actual_vs_forecast(daily_actual, full_forecast_df), use_container_width=True)
+
+    st.subheader("📋 Daily Sales Overview")
+    st.plotly_chart(plot_daily_bar_chart(daily_actual), use_container_width=True)
+
+    st.subheader("📆 Daily Forecast Table")
+    st.dataframe(generate_daily_table(forecast_df).style.format({'Forecasted Sales': '{:,.0f}'}), use_container_width=True)
+
+    # ---------------- REGION FORECAST ----------------
+    if has_region:
+        with st.expander("🌍 Region-Wise Forecast 🍧"):
+            if st.checkbox("Show Region Summary"):
+                region_df = forecast_by_region(df_clean, model_choice, event_dates, forecast_until, custom_days)
+                if not region_df.empty:
+                    st.dataframe(region_df.style.format({'Forecasted_Volume': '{:,.0f}'}), use_container_width=True)
+                    st.plotly_chart(plot_region_contribution_pie(region_df), use_container_width=True)
+                else:
+                    st.warning("⚠️ No region data available.")
 
 # ---------------- PAGE CONFIG ----------------
 st.set_page_config(page_title="🍦 H I C O Ice Cream Sales Forecast", layout="wide")
@@ -28,12 +86,12 @@ with st.expander("📤 Upload Your Sales File (CSV or Excel)"):
 
 if uploaded_file:
     try:
-        df_raw = pd.read_csv(uploaded_file) if uploaded_file.name.endswith(".csv") else pd.read_excel(uploaded_file, engine='openpyxl')
+        raw_bytes = uploaded_file.getvalue()
+        df_raw = load_file(raw_bytes, uploaded_file.name, nrows=HEADER_ROWS)
     except Exception as e:
         st.error(f"🍓 Error reading file: {e}")
         st.stop()
 
-    df_raw.columns = df_raw.columns.str.lower().str.strip().str.replace(" ", "_").str.replace(r'[^\w\s]', '', regex=True)
     st.session_state.df_raw = df_raw
     st.success("✅ File uploaded successfully! Let's get forecasting 🍦")
 
@@ -41,43 +99,51 @@ if uploaded_file:
         st.dataframe(df_raw.head(), use_container_width=True)
     # ---------------- COLUMN SELECTION ----------------
     with st.expander("🔧 Customize Your Forecast Setup", expanded=True):
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            date_col = st.selectbox("📅 Date Column", df_raw.select_dtypes(include=["object", "datetime"]).columns)
-        with col2:
-            target_col = st.selectbox("🍦 Sales/Quantity Column", df_raw.select_dtypes("number").columns)
-        with col3:
-            filters = st.multiselect("🔍 Optional Filters", [col for col in df_raw.columns if col not in [date_col, target_col]])
-
-        df_clean = preprocess_data(df_raw, date_col, target_col, filters)
-        st.session_state.df_clean = df_clean
+        with st.form("config"):
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                date_col = st.selectbox("📅 Date Column", df_raw.select_dtypes(include=["object", "string", "datetime"]).columns)
+            with col2:
+                target_col = st.selectbox("🍦 Sales/Quantity Column", df_raw.select_dtypes("number").columns)
+            with col3:
+                filters = st.multiselect("🔍 Optional Filters", [col for col in df_raw.columns if col not in [date_col, target_col]])
+            st.form_submit_button("✅ Apply Setup", use_container_width=True)
+
+        setup_key = (uploaded_file.file_id, date_col, target_col, tuple(filters))
+        if st.session_state.get('setup_key') != setup_key:
+            # region is always kept for the region summary
+            keep_filters = list(dict.fromkeys(filters + (['region'] if 'region' in df_raw.columns else [])))
+            positions = sorted({df_raw.columns.get_loc(c) for c in [date_col, target_col, *keep_filters]})
+            try:
+                df_cols = load_file(raw_bytes, uploaded_file.name, usecols=positions)
+            except Exception as e:
+                st.error(f"🍓 Error reading file: {e}")
+                st.stop()
+            st.session_state.df_clean = preprocess_data(df_cols, date_col, target_col, keep_filters)
+            st.session_state.daily_actual = aggregate_daily(st.session_state.df_clean)
+            st.session_state.setup_key = setup_key
+        df_clean = st.session_state.df_clean
 
     # ---------------- FORECAST SETTINGS ----------------
     st.markdown("## 🔮 Choose Your Forecast Settings")
     col1, col2 = st.columns(2)
     with col1:
-        model_choice = st.radio("📘 Forecast Method", ["Prophet", "Linear", "Exponential"], horizontal=True)
+        model_choice = st.radio("📘 Forecast Method", ["Prophet", "Linear", "Exponential", "StatsForecast"], horizontal=True)
         st.caption(get_forecast_explanation(model_choice))
     with col2:
         target_mode = st.radio("📆 Target Period", ["Monthly", "Yearly"], horizontal=True)
         target_value = st.number_input("🎯 Enter Sales Target", step=1000)
 
     st.markdown("### ⏳ Forecast Duration")
-    forecast_range = st.selectbox("How far do you want to forecast?", ["Till Month End", "Till Quarter End", "Till Year End", "Custom Days"])
-    forecast_until = 'year_end'
-    custom_days = None
-    if forecast_range == "Till Month End":
-        forecast_until = 'month_end'
-    elif forecast_range == "Till Quarter End":
-        forecast_until = 'quarter_end'
-    elif forecast_range == "Custom Days":
-        forecast_until = 'custom'
-        custom_days = st.number_input("🗓️ Enter custom days", min_value=1, value=30)
+    forecast_range = st.selectbox("How far do you want to forecast?", list(FORECAST_HORIZONS))
+    forecast_until = FORECAST_HORIZONS[forecast_range]
+    custom_days = st.number_input("🗓️ Enter custom days", min_value=1, value=30) if forecast_until == 'custom' else None
 
     # ---------------- EVENTS ----------------
     with st.expander("🎉 Add Seasonal Events? (e.g., Eid, Summer Launch)"):
         include_events = st.radio("Include Special Dates?", ["No", "Yes"], horizontal=True)
-        event_dates = st.date_input("📌 Pick Dates", []) if include_events == "Yes" else []
+        picked_dates = st.date_input("📌 Pick Dates", []) if include_events == "Yes" else []
+        event_dates = tuple(sorted(pd.Timestamp(d).value for d in picked_dates))
 
     # ---------------- RUN FORECAST ----------------
     if st.button("🍨 Generate Forecast!", use_container_width=True):
@@ -102,8 +168,8 @@ if uploaded_file:
         st.markdown("## 🍦 Forecast Results & Dashboard")
 
         with st.expander("📈 Target Achievement Overview", expanded=True):
-            metrics = calculate_target_analysis(
-                st.session_state.df_clean,
+            metrics, metrics_display = calculate_target_analysis(
+                st.session_state.daily_actual,
                 st.session_state.forecast_df,
                 st.session_state.last_data_date,
                 st.session_state.target_value,
@@ -111,16 +177,13 @@ if uploaded_file:
             )
 
             # Show key metrics
-            col1, col2, col3 = st.columns(3)
-            keys = list(metrics.keys())
-            for i, col in enumerate([col1, col2, col3]):
-                if i < len(keys):
-                    col.metric(label=f"🍧 {keys[i]}", value=str(metrics[keys[i]]))
+            items = list(metrics_display.items())
+            for col, (key, value) in zip(st.columns(3), items[:3]):
+                col.metric(label=f"🍧 {key}", value=str(value))
 
             # Show other metrics as text
-            if len(keys) > 3:
-                for i in range(3, len(keys)):
-                    st.write(f" **{keys[i]}:** {metrics[keys[i]]}")
+            if len(items) > 3:
+                st.markdown("  \n".join(f"**{key}:** {value}" for key, value in items[3:]))
 
             st.success("📌 " + generate_recommendations(metrics))
 
@@ -136,32 +199,10 @@ if uploaded_file:
             st.session_state.show_charts = True
 
         if st.session_state.show_charts:
-            st.subheader("📈 Forecast Trend")
-            st.plotly_chart(plot_forecast(st.session_state.full_forecast_df), use_container_width=True)
-
-            st.subheader("📉 Actual vs Forecast")
-            st.plotly_chart(plot_actual_vs_forecast(st.session_state.df_clean, st.session_state.full_forecast_df), use_container_width=True)
-
-            st.subheader("📋 Daily Sales Overview")
-            st.plotly_chart(plot_daily_bar_chart(st.session_state.df_clean), use_container_width=True)
-
-            st.subheader("📆 Daily Forecast Table")
-            st.dataframe(generate_daily_table(st.session_state.forecast_df), use_container_width=True)
-
-            # ---------------- REGION FORECAST ----------------
-            if 'region' in df_raw.columns:
-                with st.expander("🌍 Region-Wise Forecast 🍧"):
-                    if st.checkbox("Show Region Summary"):
-                        df_region = preprocess_data(df_raw, date_col, target_col, ['region'])
-                        region_df = forecast_by_region(df_region, model_choice, event_dates, forecast_until, custom_days)
-                        if not region_df.empty:
-                            st.dataframe(region_df, use_container_width=True)
-                            st.plotly_chart(
-                                px.pie(region_df, names='Region', values='Forecasted_Volume',
-                                       title='📍 Region-wise Forecasted Contribution'),
-                                use_container_width=True
-                            )
-                        else:
-                            st.warning("⚠️ No region data available.")
+            render_charts(
+                st.session_state.df_clean, st.session_state.daily_actual,
+                st.session_state.full_forecast_df, st.session_state.forecast_df,
+                'region' in df_raw.columns, model_choice, event_dates, forecast_until, custom_days
+            )
 else:
     st.info(" Please upload your Data file to get started!")
@@ -0,0 +1,117 @@
+import contextlib
+import hashlib
+import io
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+import pandas as pd
+
+# ---------------- READERS ----------------
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+CSV_ENGINE = 'pyarrow' if HAS_PYARROW else 'c'
+DTYPE_BACKEND = 'pyarrow' if HAS_PYARROW else 'numpy_nullable'
+
+# ---------------- LOADING ----------------
+_COL_JUNK = re.compile(r'[^\w\s]')
+
+def clean_column(name):
+    return _COL_JUNK.sub('', str(name).lower().strip().replace(" ", "_"))
+
+HEADER_ROWS = 1000
+LARGE_CSV_BYTES = 100 * 1024 * 1024
+CSV_CHUNK_ROWS = 500_000
+
+PARQUET_CACHE_DIR = Path(tempfile.gettempdir()) / 'hico_cache'
+PARQUET_CACHE_MAX_BYTES = 512 * 1024 * 1024
+PARQUET_CACHE_MAX_AGE = 24 * 60 * 60
+
+def _parquet_path(raw, name, usecols):
+    key = hashlib.blake2b(raw, digest_size=8)
+    key.update(f"{name}|{usecols}".encode())
+    return PARQUET_CACHE_DIR / f"{key.hexdigest()}.parquet"
+
+def _read_parquet_copy(pq):
+    try:
+        df = pd.read_parquet(pq, engine='pyarrow')
+    except FileNotFoundError:
+        return None
+    except (ValueError, TypeError, OSError):
+        pq.unlink(missing_ok=True)  # truncated or unreadable: re-parse the upload
+        return None
+    with contextlib.suppress(OSError):
+        os.utime(pq)  # pruning goes by mtime
+    return df
+
+def _write_parquet_copy(df, pq):
+    PARQUET_CACHE_DIR.mkdir(exist_ok=True)
+    # Renamed into place so readers never see a partial file
+    fd, tmp = tempfile.mkstemp(dir=PARQUET_CACHE_DIR, suffix='.tmp')
+    os.close(fd)
+    try:
+        df.to_parquet(tmp, engine='pyarrow', compression='zstd')
+        os.replace(tmp, pq)
+    finally:
+        Path(tmp).unlink(missing_ok=True)
+    _prune_parquet_cache()
+
+def _prune_parquet_cache():
+    entries = []
+    for path in PARQUET_CACHE_DIR.iterdir():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    cutoff = time.time() - PARQUET_CACHE_MAX_AGE
+    total = 0
+    for mtime, size, path in sorted(entries, reverse=True):
+        total += size
+        if mtime < cutoff or total > PARQUET_CACHE_MAX_BYTES:
+            path.unlink(missing_ok=True)
+
+def load_file(raw, name, usecols=None, nrows=None):
+    use_disk = nrows is None and HAS_PYARROW
+    if use_disk:
+        pq = _parquet_path(raw, name, usecols)
+        df = _read_parquet_copy(pq)
+        if df is not None:
+            return df
+    buf = io.BytesIO(raw)
+    if not name.endswith(".csv"):
+        df = pd.read_excel(buf, engine=EXCEL_ENGINE, usecols=usecols, nrows=nrows, dtype_backend=DTYPE_BACKEND)
+    elif nrows is not None:
+        df = pd.read_csv(buf, nrows=nrows, dtype_backend=DTYPE_BACKEND)
+    elif len(raw) > LARGE_CSV_BYTES:
+        df = pd.concat(pd.read_csv(buf, usecols=usecols, chunksize=CSV_CHUNK_ROWS, dtype_backend=DTYPE_BACKEND), ignore_index=True)
+    else:
+        names = usecols
+        if usecols is not None:
+            # The pyarrow engine only projects by name, so map positions through the header
+            header = pd.read_csv(io.BytesIO(raw), nrows=0).columns
+            names = [header[i] for i in usecols]
+        try:
+            df = pd.read_csv(buf, usecols=names, engine=CSV_ENGINE, dtype_backend=DTYPE_BACKEND)
+        except pd.errors.ParserError:
+            if CSV_ENGINE == 'c':
+                raise
+            # pyarrow rejects ragged rows that the C engine pads with NA
+            df = pd.read_csv(io.BytesIO(raw), usecols=usecols, engine='c', dtype_backend=DTYPE_BACKEND)
+    df.columns = [clean_column(c) for c in df.columns]
+    if use_disk:
+        try:
+            _write_parquet_copy(df, pq)
+        except (ValueError, TypeError, OSError):
+            pass  # mixed-type columns or a read-only tmp dir just skip the disk tier
+    return df
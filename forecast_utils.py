@@ -1,56 +1,172 @@
+import hashlib
+import os
+from collections import namedtuple
+from functools import lru_cache
+import numpy as np
 import pandas as pd
+import streamlit as st
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from prophet import Prophet
-import plotly.graph_objects as go
-import plotly.express as px
 from numpy import polyfit
-from statsmodels.tsa.holtwinters import ExponentialSmoothing
+from numba import config as numba_config, get_num_threads, njit, prange
+from scipy.optimize import minimize
+from statsforecast import StatsForecast
+from statsforecast.models import AutoETS
 from calendar import monthrange
 
+# Process-wide: with TBB, the process would not exit after StatsForecast's worker pool had run
+numba_config.THREADING_LAYER_PRIORITY = ['omp', 'tbb', 'workqueue']
+
 def preprocess_data(df, date_col, target_col, filters=[]):
     df = df[[date_col, target_col] + filters].copy()
     df.columns = ['date', 'target'] + filters
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
+    # utc=True maps tz-aware and mixed-offset dates to naive UTC; naive dates are unchanged
+    df['date'] = pd.to_datetime(df['date'], errors='coerce', utc=True).dt.tz_convert(None).astype('datetime64[ns]')
     df['target'] = pd.to_numeric(df['target'], errors='coerce')
     df.dropna(subset=['date', 'target'], inplace=True)
+    df['target'] = df['target'].astype(np.float32)
+    # Later groupby(sort=False) calls rely on this date order
+    df.sort_values('date', inplace=True, kind='stable')
+    for f in filters:
+        df[f] = df[f].astype(pd.CategoricalDtype(ordered=True))
     return df
 
-def forecast_sales(df, model_type, target_mode, event_dates=None, forecast_until='year_end', custom_days=None):
-    df_grouped = df.groupby("date")["target"].sum().reset_index()
-    df_grouped.columns = ['ds', 'y']
-    df_grouped = df_grouped.sort_values("ds")
-    last_data_date = pd.to_datetime(df_grouped['ds'].max())
-
+def _forecast_end(last_data_date, forecast_until, custom_days=None):
     if forecast_until == 'month_end':
         year, month = last_data_date.year, last_data_date.month
-        end_date = datetime(year, month, monthrange(year, month)[1])
+        return datetime(year, month, monthrange(year, month)[1])
     elif forecast_until == 'quarter_end':
         q_month = ((last_data_date.month - 1) // 3 + 1) * 3
-        end_date = datetime(last_data_date.year, q_month, monthrange(last_data_date.year, q_month)[1])
+        return datetime(last_data_date.year, q_month, monthrange(last_data_date.year, q_month)[1])
     elif forecast_until == 'custom':
-        end_date = last_data_date + timedelta(days=custom_days)
+        return last_data_date + timedelta(days=custom_days)
+    return datetime(last_data_date.year, 12, 31)
+
+@lru_cache(maxsize=64)
+def _future_dates(last_data_value, forecast_until, custom_days=None):
+    last_data_date = pd.Timestamp(last_data_value)
+    end_date = _forecast_end(last_data_date, forecast_until, custom_days)
+    return pd.date_range(start=last_data_date + timedelta(days=1), end=end_date)
+
+def _frame_digest(df):
+    return hashlib.blake2b(pd.util.hash_pandas_object(df, index=False).values.tobytes(), digest_size=16).hexdigest()
+
+def _event_key(event_dates):
+    # Accepts dates, Timestamps or the ns ints of an earlier key
+    events = np.unique(np.asarray(list(event_dates or ()), dtype='datetime64[ns]'))
+    return tuple(events.view(np.int64).tolist())
+
+@st.cache_data(show_spinner=False)
+def _build_holidays(events):
+    return pd.DataFrame({'holiday': 'event', 'ds': np.asarray(events, dtype='datetime64[ns]')})
+
+def _prophet_point_forecast(model, future_dates):
+    # Same yhat as model.predict()
+    future = model.setup_dataframe(pd.DataFrame({'ds': future_dates}))
+    trend = model.predict_trend(future).to_numpy()
+    seasonal = model.predict_seasonal_components(future)
+    yhat = trend * (1 + seasonal['multiplicative_terms'].to_numpy()) + seasonal['additive_terms'].to_numpy()
+    return pd.DataFrame({'ds': future_dates, 'yhat': yhat})
+
+_SMOOTHING_BOUNDS = (1e-4, 1 - 1e-4)
+_SMOOTHING_GRID = np.concatenate([np.geomspace(1e-4, 0.1, 8), np.linspace(0.15, 1 - 1e-4, 8)])
+_SMOOTHING_OPTIONS = {'maxiter': 50}
+
+@njit(cache=True, fastmath=True)
+def _holt_sse(y, alpha, beta):
+    # Holt's additive trend. Forecasts are linear in the initial state, f_t = c_t + p_t * l0 + q_t * b0
+    # (c from a zero state, p/q from unit l0/b0), so the SSE-optimal l0, b0 is a 2x2 least-squares solve.
+    # Returns the SSE and the final level/trend.
+    one_minus_alpha = 1.0 - alpha
+    alpha_beta = alpha * beta
+    one_minus_alpha_beta = 1.0 - alpha_beta
+    cl, cb, pl, pb, ql, qb = 0.0, 0.0, 1.0, 0.0, 0.0, 1.0
+    spp = spq = sqq = spr = sqr = srr = 0.0
+    for t in range(y.size):
+        c, p, q = cl + cb, pl + pb, ql + qb
+        r = y[t] - c
+        spp += p * p
+        spq += p * q
+        sqq += q * q
+        spr += p * r
+        sqr += q * r
+        srr += r * r
+        cl, cb = alpha * y[t] + one_minus_alpha * c, alpha_beta * y[t] - alpha_beta * cl + one_minus_alpha_beta * cb
+        pl, pb = one_minus_alpha * p, -alpha_beta * pl + one_minus_alpha_beta * pb
+        ql, qb = one_minus_alpha * q, -alpha_beta * ql + one_minus_alpha_beta * qb
+    det = spp * sqq - spq * spq
+    if det > 1e-12 * spp * sqq:
+        l0 = (sqq * spr - spq * sqr) / det
+        b0 = (spp * sqr - spq * spr) / det
     else:
-        end_date = datetime(last_data_date.year, 12, 31)
+        l0, b0 = spr / spp, 0.0
+    sse = max(srr - l0 * spr - b0 * sqr, 0.0)
+    return sse, cl + l0 * pl + b0 * ql, cb + l0 * pb + b0 * qb
 
-    future_dates = pd.date_range(start=last_data_date + timedelta(days=1), end=end_date)
-    forecast_days = len(future_dates)
-    if forecast_days <= 0:
-        return pd.DataFrame(), last_data_date, 0, df_grouped
+def _fit_holt(y):
+    # The SSE surface has local minima and often bottoms out on the bounds; the grid picks the basin
+    sse = np.array([[_holt_sse(y, alpha, beta)[0] for beta in _SMOOTHING_GRID] for alpha in _SMOOTHING_GRID])
+    i, j = np.unravel_index(sse.argmin(), sse.shape)
+    best = minimize(lambda p: _holt_sse(y, p[0], p[1])[0], x0=[_SMOOTHING_GRID[i], _SMOOTHING_GRID[j]],
+                    method='L-BFGS-B', bounds=[_SMOOTHING_BOUNDS] * 2, options=_SMOOTHING_OPTIONS)
+    _, level, trend = _holt_sse(y, best.x[0], best.x[1])
+    return level, trend
+
+_EPOCH_ORDINAL = datetime(1970, 1, 1).toordinal()
 
+def _ordinals(dates):
+    # Same values as date.toordinal()
+    return np.asarray(dates).astype('datetime64[D]').astype(np.int64) + _EPOCH_ORDINAL
+
+# AutoETS raises "tiny datasets" on anything shorter
+STATSFORECAST_MIN_DAYS = 7
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def _fit_model(history_digest, model_type, events, _history):
+    # _history is not hashed; history_digest stands in for it
     if model_type == "Prophet":
-        model = Prophet(daily_seasonality=True)
-        model.fit(df_grouped)
-        future = pd.DataFrame({'ds': future_dates})
-        forecast = model.predict(future)[['ds', 'yhat']]
+        model = Prophet(daily_seasonality=True, holidays=_build_holidays(events) if events else None,
+                        uncertainty_samples=0, mcmc_samples=0)
+        return model.fit(_history)
     elif model_type == "Linear":
-        df_grouped['ds_ord'] = df_grouped['ds'].map(datetime.toordinal)
-        m, b = polyfit(df_grouped['ds_ord'], df_grouped['y'], 1)
-        forecast = pd.DataFrame({'ds': future_dates})
-        forecast['yhat'] = [m * d.toordinal() + b for d in forecast['ds']]
+        return polyfit(_ordinals(_history['ds']), _history['y'].to_numpy(np.float64), 1)
     elif model_type == "Exponential":
-        model = ExponentialSmoothing(df_grouped['y'], trend='add').fit()
-        forecast_vals = model.forecast(forecast_days)
-        forecast = pd.DataFrame({'ds': future_dates, 'yhat': forecast_vals})
+        return _fit_holt(_history['y'].to_numpy(np.float64))
+    elif model_type == "StatsForecast":
+        sf = StatsForecast(models=[AutoETS(season_length=7)], freq='D')
+        return sf.fit(df=_history.assign(unique_id='total'))
+
+def _predict(model_type, model, future_dates):
+    if model_type == "Prophet":
+        return _prophet_point_forecast(model, future_dates)
+    elif model_type == "Linear":
+        m, b = model
+        return pd.DataFrame({'ds': future_dates, 'yhat': m * _ordinals(future_dates) + b})
+    elif model_type == "Exponential":
+        level, trend = model
+        return pd.DataFrame({'ds': future_dates, 'yhat': level + trend * np.arange(1, len(future_dates) + 1)})
+    elif model_type == "StatsForecast":
+        return pd.DataFrame({'ds': future_dates, 'yhat': model.predict(h=len(future_dates))['AutoETS'].to_numpy()})
+
+def aggregate_daily(df):
+    totals = df.groupby("date", sort=False)["target"].sum()
+    if not totals.index.is_monotonic_increasing:
+        totals = totals.sort_index()
+    return pd.DataFrame({'ds': totals.index.to_numpy(), 'y': totals.to_numpy()})
+
+def forecast_sales(df, model_type, target_mode, event_dates=None, forecast_until='year_end', custom_days=None):
+    df_grouped = aggregate_daily(df)
+    last_data_date = pd.to_datetime(df_grouped['ds'].max())
+
+    future_dates = _future_dates(last_data_date.value, forecast_until, custom_days)
+    forecast_days = len(future_dates)
+    if forecast_days <= 0 or (model_type == "StatsForecast" and len(df_grouped) < STATSFORECAST_MIN_DAYS):
+        return pd.DataFrame(), last_data_date, 0, df_grouped
+
+    events = _event_key(event_dates)
+    model = _fit_model(_frame_digest(df_grouped), model_type, events, df_grouped)
+    forecast = _predict(model_type, model, future_dates)
 
     forecast_full = pd.concat([
         df_grouped[['ds', 'y']].rename(columns={'y': 'yhat'}),
@@ -62,38 +178,118 @@ def forecast_sales(df, model_type, target_mode, event_dates=None, forecast_until
 
     return forecast, last_data_date, forecast_days, forecast_full
 
+def _fit_and_sum(region_df, model_type, events, forecast_until, custom_days):
+    # Module level so worker processes can unpickle it
+    forecast, _, _, _ = forecast_sales(region_df, model_type, 'Yearly', events, forecast_until, custom_days)
+    return None if forecast.empty else float(forecast['yhat'].sum())
+
 def forecast_by_region(df, model_type, event_dates=None, forecast_until='year_end', custom_days=None):
     df = df.copy()
     df.columns = df.columns.str.lower()
     if 'region' not in df.columns or 'date' not in df.columns or 'target' not in df.columns:
         return pd.DataFrame(columns=['Region', 'Forecasted_Volume'])
+    if not isinstance(df['region'].dtype, pd.CategoricalDtype):
+        df['region'] = df['region'].astype('category')
+
+    all_daily = df.groupby(['region', 'date'], sort=False, observed=True)['target'].sum()
+    if all_daily.empty:
+        return pd.DataFrame(columns=['Region', 'Forecasted_Volume'])
+
+    if model_type == "StatsForecast":
+        totals = _statsforecast_region_totals(all_daily, forecast_until, custom_days)
+    else:
+        events = _event_key(event_dates)
+        regions = all_daily.groupby(level='region', sort=False, observed=True)
+        with ProcessPoolExecutor(max_workers=min(regions.ngroups, os.cpu_count() or 1)) as ex:
+            futures = {
+                ex.submit(_fit_and_sum, daily.droplevel('region').reset_index(), model_type, events, forecast_until, custom_days): region
+                for region, daily in regions
+            }
+            sums = {futures[future]: future.result() for future in as_completed(futures)}
+        totals = {region: total for region, total in sums.items() if total is not None}
 
-    regions = df['region'].dropna().unique()
-    region_forecasts = []
-
-    for region in regions:
-        region_df = df[df['region'] == region]
-        if region_df.empty:
-            continue
-        forecast, _, _, _ = forecast_sales(region_df, model_type, 'Yearly', event_dates, forecast_until, custom_days)
-        if not forecast.empty:
-            total = forecast['yhat'].sum()
-            region_forecasts.append({
-                'Region': region,
-                'Forecasted_Volume': "{:,}".format(round(total))
-            })
+    region_forecasts = [
+        {'Region': region, 'Forecasted_Volume': round(total)}
+        for region, total in totals.items()
+    ]
 
     df_out = pd.DataFrame(region_forecasts)
     return df_out.sort_values(by="Forecasted_Volume", ascending=False) if not df_out.empty else df_out
 
+def _statsforecast_region_totals(all_daily, forecast_until, custom_days=None):
+    # Fits every region at the longest horizon, then trims each back to its own end date
+    daily = pd.DataFrame({
+        'unique_id': all_daily.index.get_level_values('region'),
+        'ds': all_daily.index.get_level_values('date'),
+        'y': all_daily.to_numpy()
+    })
+    spans = daily.groupby('unique_id', sort=False, observed=True)['ds'].agg(['max', 'size'])
+    # Regions too short for AutoETS are left out, as other models leave out regions with no forecast
+    last_dates = spans.loc[spans['size'] >= STATSFORECAST_MIN_DAYS, 'max']
+    if last_dates.empty:
+        return {}
+    if len(last_dates) < len(spans):
+        daily = daily[daily['unique_id'].isin(last_dates.index)]
+        if isinstance(daily['unique_id'].dtype, pd.CategoricalDtype):
+            daily['unique_id'] = daily['unique_id'].cat.remove_unused_categories()
+    end_dates = {region: pd.Timestamp(_forecast_end(last, forecast_until, custom_days)) for region, last in last_dates.items()}
+    horizon = max((end_dates[region] - last).days for region, last in last_dates.items())
+    if horizon <= 0:
+        return {}
+
+    sf = StatsForecast(models=[AutoETS(season_length=7)], freq='D', n_jobs=-1)
+    forecast = sf.forecast(df=daily, h=horizon)
+    codes, regions = pd.factorize(forecast['unique_id'])
+    cutoffs = np.array([end_dates[region].value for region in regions], dtype=np.int64)
+    totals, counts = _filter_group_sum(
+        forecast['ds'].to_numpy('datetime64[ns]').view('i8'), codes,
+        forecast['AutoETS'].to_numpy(np.float64), cutoffs, get_num_threads()
+    )
+    return {region: total for region, total, count in zip(regions, totals.tolist(), counts) if count}
+
+@njit(cache=True, parallel=True)
+def _filter_group_sum(dates, codes, values, cutoffs, n_chunks):
+    # A zero count marks a region with no rows inside its horizon
+    step = (dates.size + n_chunks - 1) // n_chunks
+    totals = np.zeros((n_chunks, cutoffs.size))
+    counts = np.zeros((n_chunks, cutoffs.size), dtype=np.int64)
+    for chunk in prange(n_chunks):
+        for i in range(chunk * step, min((chunk + 1) * step, dates.size)):
+            code = codes[i]
+            if dates[i] <= cutoffs[code]:
+                totals[chunk, code] += values[i]
+                counts[chunk, code] += 1
+    return totals.sum(axis=0), counts.sum(axis=0)
+
 def plot_region_contribution_pie(df):
+    import plotly.graph_objects as go
     if 'Region' in df.columns and 'Forecasted_Volume' in df.columns and not df.empty:
-        return px.pie(df, names='Region', values='Forecasted_Volume', title='Region-wise Forecasted Contribution')
+        fig = go.Figure(go.Pie(labels=df['Region'].to_numpy(), values=df['Forecasted_Volume'].to_numpy()))
+        fig.update_layout(title='📍 Region-wise Forecasted Contribution')
+        return fig
     return go.Figure()
 
+TREND_WINDOW = 7
+
+@njit(cache=True, fastmath=True)
+def _slope(y, window):
+    # Least-squares slope of the window-day rolling mean
+    m = y.size - window + 1
+    x_mean = (m - 1) / 2.0
+    running = 0.0
+    for i in range(window):
+        running += y[i]
+    acc = -x_mean * running
+    for i in range(1, m):
+        running += y[i + window - 1] - y[i - 1]
+        acc += (i - x_mean) * running
+    return acc / window / (m * (m * m - 1) / 12.0)
+
 def detect_pattern(df_grouped):
-    df_grouped['rolling_mean'] = df_grouped['y'].rolling(window=7).mean()
-    slope = polyfit(range(len(df_grouped['rolling_mean'].dropna())), df_grouped['rolling_mean'].dropna(), 1)[0]
+    y = df_grouped['y'].to_numpy(np.float64)
+    if y.size < TREND_WINDOW + 1:
+        raise ValueError(f"at least {TREND_WINDOW + 1} days of data are needed to detect a trend")
+    slope = _slope(y, TREND_WINDOW)
     if abs(slope) < 1e-2:
         return "Stationary or flat trend"
     elif slope > 0:
@@ -101,20 +297,33 @@ def detect_pattern(df_grouped):
     else:
         return "Downward trend detected"
 
-def calculate_target_analysis(df, forecast_df, last_date, target, mode):
+TargetAnalysis = namedtuple('TargetAnalysis', 'target current forecast total remaining days_left per_day pct')
+
+def calculate_target_analysis(daily_actual, forecast_df, last_date, target, mode):
+    # daily_actual is sorted by ds, so the month/year to date is the contiguous slice [start, end)
     if mode == 'Monthly':
-        current = df[(df['date'].dt.month == last_date.month) & (df['date'].dt.year == last_date.year)]['target'].sum()
+        start = pd.Timestamp(last_date.year, last_date.month, 1)
+        end = start + pd.offsets.MonthBegin(1)
     else:
-        current = df[df['date'].dt.year == last_date.year]['target'].sum()
+        start = pd.Timestamp(last_date.year, 1, 1)
+        end = pd.Timestamp(last_date.year + 1, 1, 1)
+    dates = daily_actual['ds'].to_numpy('datetime64[ns]').view('i8')
+    lo = np.searchsorted(dates, start.value, side='left')
+    hi = np.searchsorted(dates, end.value, side='left')
+    current = daily_actual['y'].to_numpy()[lo:hi].sum(dtype=np.float64)
 
-    forecast = forecast_df[forecast_df['ds'] > last_date]['yhat'].sum()
+    # forecast_df is date-sorted as well
+    forecast_dates = forecast_df['ds'].to_numpy('datetime64[ns]').view('i8')
+    split = np.searchsorted(forecast_dates, pd.Timestamp(last_date).value, side='right')
+    forecast = forecast_df['yhat'].to_numpy()[split:].sum()
     total = current + forecast
     remaining = max(0, target - current)
-    days_left = (forecast_df['ds'].max() - last_date).days
+    days_left = (pd.Timestamp(forecast_dates[-1]) - last_date).days
     per_day = round(remaining / days_left, 2) if days_left > 0 else 0
     pct = round((total / target) * 100, 2)
 
-    return {
+    metrics = TargetAnalysis(target, current, forecast, total, remaining, days_left, per_day, pct)
+    display = {
         "Target": "{:,}".format(round(target)),
         "Current Sales": "{:,}".format(round(current)),
         "Forecasted Sales (Remaining)": "{:,}".format(round(forecast)),
@@ -124,43 +333,87 @@ def calculate_target_analysis(df, forecast_df, last_date, target, mode):
         "Required Per Day": "{:,}".format(round(per_day)),
         "Projected % of Target": f"{pct}%"
     }
+    return metrics, display
 
 def generate_recommendations(metrics):
-    if metrics["Projected % of Target"].replace('%', '') >= "100":
+    if metrics.pct >= 100:
         return "You're on track or exceeding your goal!"
-    return f"You need to sell {metrics['Required Per Day']} units/day for {metrics['Days Left to Forecast']} days."
+    return f"You need to sell {round(metrics.per_day):,} units/day for {metrics.days_left} days."
+
+MAX_PLOT_POINTS = 2000
+_LINE_LAYOUT = {'xaxis_title': 'Date', 'yaxis_title': 'Sales'}
+
+@njit(cache=True)
+def _lttb_indices(x, y, n_out):
+    # Largest-Triangle-Three-Buckets downsampling
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0] = 0
+    keep[n_out - 1] = n - 1
+    every = (n - 2) / (n_out - 2)
+    a = 0
+    for i in range(n_out - 2):
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[avg_start:avg_end].mean()
+        avg_y = y[avg_start:avg_end].mean()
+        best, best_area = int(i * every) + 1, -1.0
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best, best_area = j, area
+        keep[i + 1] = best
+        a = best
+    return keep
+
+def _downsample(df, y_col):
+    if len(df) <= MAX_PLOT_POINTS:
+        return df
+    x = df['ds'].to_numpy('datetime64[ns]').view('i8')
+    x = (x - x[0]).astype(np.float64)
+    return df.iloc[_lttb_indices(x, df[y_col].to_numpy(np.float64), MAX_PLOT_POINTS)]
 
 def plot_forecast(df):
+    import plotly.graph_objects as go
+    df = _downsample(df, 'yhat')
+    x = df['ds'].to_numpy()
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=df['ds'], y=df['yhat'], name='Forecast'))
-    fig.add_trace(go.Scatter(x=df['ds'], y=df['yhat_upper'], name='Upper', line=dict(dash='dot')))
-    fig.add_trace(go.Scatter(x=df['ds'], y=df['yhat_lower'], name='Lower', line=dict(dash='dot')))
-    fig.update_layout(title="Forecast with Confidence Bands", xaxis_title="Date", yaxis_title="Sales")
+    fig.add_trace(go.Scattergl(x=x, y=df['yhat'].to_numpy(), name='Forecast'))
+    fig.add_trace(go.Scattergl(x=x, y=df['yhat_upper'].to_numpy(), name='Upper', line=dict(dash='dot')))
+    fig.add_trace(go.Scattergl(x=x, y=df['yhat_lower'].to_numpy(), name='Lower', line=dict(dash='dot')))
+    fig.update_layout(**_LINE_LAYOUT, title="Forecast with Confidence Bands", uirevision='forecast')
     return fig
 
-def plot_actual_vs_forecast(df, forecast_df):
-    actual = df.groupby('date')['target'].sum().reset_index()
-    actual.columns = ['ds', 'y']
-    merged = pd.merge(forecast_df[['ds', 'yhat']], actual, on='ds', how='left')
+def plot_actual_vs_forecast(daily_actual, forecast_df):
+    import plotly.graph_objects as go
+    merged = forecast_df[['ds', 'yhat']].join(daily_actual.set_index('ds'), on='ds')
+    merged = _downsample(merged, 'yhat')
+    x = merged['ds'].to_numpy()
     fig = go.Figure()
-    fig.add_trace(go.Scatter(x=merged['ds'], y=merged['yhat'], name='Forecast'))
-    fig.add_trace(go.Scatter(x=merged['ds'], y=merged['y'], name='Actual'))
-    fig.update_layout(title='Actual vs Forecasted', xaxis_title='Date', yaxis_title='Sales')
+    fig.add_trace(go.Scattergl(x=x, y=merged['yhat'].to_numpy(), name='Forecast'))
+    fig.add_trace(go.Scattergl(x=x, y=merged['y'].to_numpy(), name='Actual'))
+    fig.update_layout(**_LINE_LAYOUT, title='Actual vs Forecasted', uirevision='actual_vs_forecast')
     return fig
 
-def plot_daily_bar_chart(df):
-    daily = df.groupby('date')['target'].sum().reset_index()
-    return px.bar(daily, x='date', y='target', title="Daily Sales Trend")
+def plot_daily_bar_chart(daily_actual):
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(x=daily_actual['ds'].to_numpy(), y=daily_actual['y'].to_numpy()))
+    fig.update_layout(title="Daily Sales Trend", xaxis_title='date', yaxis_title='target', uirevision='daily_sales')
+    return fig
 
 def generate_daily_table(forecast_df):
-    df = forecast_df[['ds', 'yhat']].copy()
-    df['Forecasted Sales'] = df['yhat'].apply(lambda x: "{:,}".format(round(x)))
-    return df.rename(columns={'ds': 'Date'})[['Date', 'Forecasted Sales']]
+    return pd.DataFrame({
+        'Date': forecast_df['ds'].to_numpy(),
+        'Forecasted Sales': forecast_df['yhat'].to_numpy().round().astype(np.int64)
+    })
 
 def get_forecast_explanation(method):
     explanations = {
         "Prophet": "Prophet models trends and special events to forecast future sales.",
         "Linear": "Linear regression fits a simple trend line based on past values.",
-        "Exponential": "Exponential smoothing weighs recent values more heavily."
+        "Exponential": "Exponential smoothing weighs recent values more heavily.",
+        "StatsForecast": "StatsForecast fits a fast automatic ETS model to every series in one pass."
     }
     return explanations.get(method, "No explanation available.")
@@ -0,0 +1,64 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+import data_io
+
+pytest.importorskip("pyarrow")
+
+CSV = b"date,sales,region\n2024-01-01,10,North\n2024-01-02,12,South\n"
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_io, "PARQUET_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def test_truncated_parquet_copy_is_reparsed(cache_dir):
+    first = data_io.load_file(CSV, "sales.csv", [0, 1])
+    pq = data_io._parquet_path(CSV, "sales.csv", [0, 1])
+    pq.write_bytes(pq.read_bytes()[:20])
+
+    again = data_io.load_file(CSV, "sales.csv", [0, 1])
+    pd.testing.assert_frame_equal(again, first)
+    pd.testing.assert_frame_equal(pd.read_parquet(pq), first)
+
+
+def _entry(cache_dir, name, size, age):
+    path = cache_dir / name
+    path.write_bytes(b"x" * size)
+    mtime = time.time() - age
+    os.utime(path, (mtime, mtime))
+    return path
+
+
+def test_prune_drops_least_recently_used_first(cache_dir, monkeypatch):
+    monkeypatch.setattr(data_io, "PARQUET_CACHE_MAX_BYTES", 250)
+    old = _entry(cache_dir, "old.parquet", 100, 300)
+    mid = _entry(cache_dir, "mid.parquet", 100, 200)
+    new = _entry(cache_dir, "new.parquet", 100, 100)
+
+    data_io._prune_parquet_cache()
+    assert not old.exists()
+    assert mid.exists() and new.exists()
+
+
+def test_prune_drops_entries_past_the_age_cap(cache_dir, monkeypatch):
+    monkeypatch.setattr(data_io, "PARQUET_CACHE_MAX_AGE", 60)
+    stale = _entry(cache_dir, "stale.parquet", 10, 120)
+    fresh = _entry(cache_dir, "fresh.parquet", 10, 0)
+
+    data_io._prune_parquet_cache()
+    assert not stale.exists()
+    assert fresh.exists()
+
+
+@pytest.mark.parametrize("usecols", [None, [0, 1]])
+def test_short_rows_fall_back_to_the_c_engine(usecols):
+    raw = b"date,sales,region\n2024-01-01,10,North\n2024-01-02,2\n"
+    df = data_io.load_file(raw, "short.csv", usecols)
+    assert list(df.columns[:2]) == ["date", "sales"]
+    assert df["sales"].tolist() == [10, 2]
@@ -0,0 +1,31 @@
+import numpy as np
+import pytest
+
+from forecast_utils import _fit_holt
+
+HORIZON = 180
+
+# 180-day forecast sums from statsmodels ExponentialSmoothing(y, trend='add').fit() on the same series
+FLAT_REFERENCE_SUM = 52494.41
+TRENDING_REFERENCE_SUM = 181075.84
+
+
+def _forecast(y):
+    level, trend = _fit_holt(y)
+    return level + trend * np.arange(1, HORIZON + 1)
+
+
+def test_flat_noisy_series_matches_statsmodels():
+    y = 300 + np.random.default_rng(0).normal(0, 50, 365)
+    forecast = _forecast(y)
+    assert forecast.sum() > 0
+    np.testing.assert_allclose(forecast.sum(), FLAT_REFERENCE_SUM, rtol=1e-2)
+    assert abs(forecast[-1] - forecast[0]) < 0.1 * y.std()
+
+
+def test_trending_series_matches_statsmodels():
+    t = np.arange(365.0)
+    y = 100 + 2 * t + np.random.default_rng(1).normal(0, 20, 365)
+    forecast = _forecast(y)
+    np.testing.assert_allclose(forecast.sum(), TRENDING_REFERENCE_SUM, rtol=1e-2)
+    assert _fit_holt(y)[1] == pytest.approx(2, abs=0.1)
@@ -0,0 +1,16 @@
+import pandas as pd
+import pytest
+
+from forecast_utils import preprocess_data
+
+
+@pytest.mark.parametrize("dates, expected", [
+    (["2024-01-01", "2024-01-02"], ["2024-01-01 00:00", "2024-01-02 00:00"]),
+    (["2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z"], ["2024-01-01 00:00", "2024-01-02 00:00"]),
+    (["2024-01-01T00:00:00+05:00", "2024-01-02T00:00:00+05:00"], ["2023-12-31 19:00", "2024-01-01 19:00"]),
+    (["2024-01-01T00:00:00+05:00", "2024-01-02T00:00:00Z"], ["2023-12-31 19:00", "2024-01-02 00:00"]),
+])
+def test_dates_are_naive_datetime64(dates, expected):
+    df = preprocess_data(pd.DataFrame({"d": dates, "t": [1, 2]}), "d", "t")
+    assert df["date"].dtype == "datetime64[ns]"
+    assert df["date"].tolist() == list(pd.to_datetime(expected))
@@ -0,0 +1,17 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from forecast_utils import calculate_target_analysis
+
+
+@pytest.mark.parametrize("mode", ["Monthly", "Yearly"])
+def test_current_period_keeps_rows_after_midnight_on_the_last_day(mode):
+    # December 2023 then January 2024, stamped at 15:00; only January is in either period
+    daily = pd.DataFrame({
+        'ds': pd.date_range('2023-12-01 15:00', periods=62),
+        'y': np.full(62, 160, dtype=np.float32),
+    })
+    forecast = pd.DataFrame({'ds': pd.date_range('2024-02-01 15:00', periods=29), 'yhat': 2.0})
+    metrics, _ = calculate_target_analysis(daily, forecast, daily['ds'].iloc[-1], 10_000, mode)
+    assert metrics.current == 31 * 160